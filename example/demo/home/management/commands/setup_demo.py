@@ -1,6 +1,7 @@
 from datetime import date
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 
 from wagtail.models import Locale, Page, Site
 
@@ -10,6 +11,8 @@ from demo.home.models import ArticlePage, HomePage
 class Command(BaseCommand):
     help = "Set up demo content for the intentional blanks example"
 
+    # One transaction for all the demo content, rather than a commit per save
+    @transaction.atomic
     def handle(self, *args, **options):
         self.stdout.write("Creating example content...")
 
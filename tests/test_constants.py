@@ -7,6 +7,7 @@ from django.test import TestCase, override_settings
 from wagtail_localize_intentional_blanks.constants import (
     DEFAULTS,
     DO_NOT_TRANSLATE_MARKER,
+    get_cached_setting,
     get_setting,
 )
 
@@ -64,3 +65,14 @@ class TestConstants(TestCase):
         """Test get_setting when default is None."""
         value = get_setting("NONEXISTENT_KEY")
         assert value is None
+
+    def test_get_cached_setting_follows_setting_changes(self):
+        """Test get_cached_setting is refreshed when one of our settings changes."""
+        assert get_cached_setting("REQUIRED_PERMISSION") is None
+
+        with override_settings(
+            WAGTAIL_LOCALIZE_INTENTIONAL_BLANKS_REQUIRED_PERMISSION="cms.can_translate"
+        ):
+            assert get_cached_setting("REQUIRED_PERMISSION") == "cms.can_translate"
+
+        assert get_cached_setting("REQUIRED_PERMISSION") is None
@@ -10,7 +10,9 @@ import pytest
 import uuid
 from django.contrib.auth import get_user_model
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection, transaction
 from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from wagtail.models import Locale, Page
 from wagtail_localize.models import (
@@ -32,7 +34,10 @@ from wagtail_localize_intentional_blanks.constants import (
     BACKUP_SEPARATOR,
     DO_NOT_TRANSLATE_MARKER,
 )
-from wagtail_localize_intentional_blanks.utils import mark_segment_do_not_translate
+from wagtail_localize_intentional_blanks.utils import (
+    bulk_mark_segments,
+    mark_segment_do_not_translate,
+)
 
 
 User = get_user_model()
@@ -73,6 +78,82 @@ class TestPatchFunctionality(TestCase):
             target_locale=self.target_locale,
         )
 
+    def _segments_qs(self, source):
+        """
+        Return the source's StringSegments with their related rows loaded up front.
+
+        Strings and contexts are fetched with the segments, so assertions don't
+        lazy-load each relation per segment.
+        """
+        return StringSegment.objects.filter(source=source).select_related(
+            "string", "context"
+        )
+
+    def _string_segments(self, source=None):
+        """
+        Get the string segment values the patched method returns for the target locale.
+
+        Uses fallback=True so the page's automatically created segments (title,
+        slug, etc) don't raise MissingTranslationError.
+        """
+        source = source or self.source
+        return [
+            s
+            for s in source._get_segments_for_translation(
+                self.target_locale, fallback=True
+            )
+            if getattr(s, "string", None) is not None
+        ]
+
+    def _bulk_create_string_segments(self, items):
+        """
+        Create Strings, TranslationContexts and StringSegments for the test source.
+
+        Each relation is inserted with a single bulk_create() instead of one
+        INSERT per segment.
+
+        Args:
+            items: List of (source_value, context_path, order) tuples
+
+        Returns:
+            List of the created StringSegment instances, in the same order as items
+        """
+        with transaction.atomic():
+            strings = String.objects.bulk_create(
+                [
+                    String(
+                        data=data,
+                        data_hash=String._get_data_hash(data),
+                        locale=self.source_locale,
+                    )
+                    for data, _, _ in items
+                ]
+            )
+            contexts = TranslationContext.objects.bulk_create(
+                [
+                    TranslationContext(
+                        object=self.source.object,
+                        path=path,
+                        path_id=TranslationContext._get_path_id(path),
+                    )
+                    for _, path, _ in items
+                ]
+            )
+            return StringSegment.objects.bulk_create(
+                [
+                    StringSegment(
+                        source=self.source,
+                        string=string,
+                        context=context_obj,
+                        order=order,
+                        attrs="{}",
+                    )
+                    for string, context_obj, (_, _, order) in zip(
+                        strings, contexts, items
+                    )
+                ]
+            )
+
     def test_patch_replaces_plain_marker_with_source_value(self):
         """Test that _get_segments_for_translation replaces plain marker with source value."""
         # Create a string segment with source value
@@ -101,14 +182,8 @@ class TestPatchFunctionality(TestCase):
         )
         assert st.data == DO_NOT_TRANSLATE_MARKER
 
-        # Get segments for translation using the patched method
-        # Use fallback=True to handle automatically created page segments (title, slug, etc)
-        segments = self.source._get_segments_for_translation(
-            self.target_locale, fallback=True
-        )
-
-        # Find our segment in the results
-        string_segments = [s for s in segments if hasattr(s, "string")]
+        # Get segments for translation using the patched method, and find ours
+        string_segments = self._string_segments()
         assert len(string_segments) > 0
 
         # The segment should have the source value, not the marker
@@ -161,13 +236,8 @@ class TestPatchFunctionality(TestCase):
         )
 
         # Get segments for translation using the patched method
-        # Use fallback=True to handle automatically created page segments (title, slug, etc)
-        segments = self.source._get_segments_for_translation(
-            self.target_locale, fallback=True
-        )
-
         # The segment should have the source value, not the marker or backup
-        string_segments = [s for s in segments if hasattr(s, "string")]
+        string_segments = self._string_segments()
         found = False
         for seg in string_segments:
             if seg.string.data == source_value:
@@ -205,13 +275,8 @@ class TestPatchFunctionality(TestCase):
         )
 
         # Get segments for translation
-        # Use fallback=True to handle automatically created page segments (title, slug, etc)
-        segments = self.source._get_segments_for_translation(
-            self.target_locale, fallback=True
-        )
-
         # The segment should have the translated value
-        string_segments = [s for s in segments if hasattr(s, "string")]
+        string_segments = self._string_segments()
         found = False
         for seg in string_segments:
             if seg.string.data == translated_value:
@@ -232,52 +297,35 @@ class TestPatchFunctionality(TestCase):
             ("source4", "translation4", True),  # Marked with backup
         ]
 
-        created_segments = []
-        for i, (source_val, trans_val, mark_as_dnt) in enumerate(segments_data):
-            string = String.objects.create(
-                data=source_val,
-                locale=self.source_locale,
-            )
-            context_obj, _ = TranslationContext.objects.get_or_create(
-                path=f"test.mixed_field_{i}", defaults={"object": self.source.object}
-            )
-            segment = StringSegment.objects.create(
-                source=self.source,
-                string=string,
-                context=context_obj,
-                order=i,
-                attrs="{}",
-            )
+        created_segments = self._bulk_create_string_segments(
+            [
+                (source_val, f"test.mixed_field_{i}", i)
+                for i, (source_val, _, _) in enumerate(segments_data)
+            ]
+        )
 
-            if trans_val and not mark_as_dnt:
-                # Normal translation
-                StringTranslation.objects.create(
-                    translation_of=string,
+        # Existing translations (normal ones, and the ones that will become backups)
+        StringTranslation.objects.bulk_create(
+            [
+                StringTranslation(
+                    translation_of_id=segment.string_id,
                     locale=self.target_locale,
-                    context=context_obj,
+                    context_id=segment.context_id,
                     data=trans_val,
                 )
-            elif trans_val and mark_as_dnt:
-                # Create translation first, then mark (creates backup)
-                StringTranslation.objects.create(
-                    translation_of=string,
-                    locale=self.target_locale,
-                    context=context_obj,
-                    data=trans_val,
-                )
-                mark_segment_do_not_translate(self.translation, segment)
-            elif mark_as_dnt:
-                # Just mark (no backup)
-                mark_segment_do_not_translate(self.translation, segment)
+                for segment, (_, trans_val, _) in zip(created_segments, segments_data)
+                if trans_val
+            ]
+        )
 
-            created_segments.append((segment, source_val, trans_val, mark_as_dnt))
+        # Marking has side effects (backup encoding) the patch must observe,
+        # so it goes through the regular API one segment at a time
+        for segment, (_, _, mark_as_dnt) in zip(created_segments, segments_data):
+            if mark_as_dnt:
+                mark_segment_do_not_translate(self.translation, segment)
 
         # Get segments for translation
-        # Use fallback=True to handle automatically created page segments (title, slug, etc)
-        segments = self.source._get_segments_for_translation(
-            self.target_locale, fallback=True
-        )
-        string_segments = [s for s in segments if hasattr(s, "string")]
+        string_segments = self._string_segments()
 
         # Verify results
         # - segments[0]: should have "translation1"
@@ -306,6 +354,54 @@ class TestPatchFunctionality(TestCase):
             "Marker should not appear in segments"
         )
 
+    def test_patch_query_count_does_not_scale_with_segments(self):
+        """Test that the patched method issues the same number of queries for any segment count."""
+        expected_queries = None
+        created = 0
+
+        for count in (4, 40, 400):
+            new_segments = self._bulk_create_string_segments(
+                [
+                    (f"scaled source {i}", f"test.scaled_field_{i}", i)
+                    for i in range(created, created + count)
+                ]
+            )
+            created += count
+
+            # Half get a normal translation, the other half are marked do not translate
+            StringTranslation.objects.bulk_create(
+                [
+                    StringTranslation(
+                        translation_of_id=segment.string_id,
+                        locale=self.target_locale,
+                        context_id=segment.context_id,
+                        data=f"scaled translation {segment.order}",
+                    )
+                    for segment in new_segments[::2]
+                ]
+            )
+            bulk_mark_segments(self.translation, new_segments[1::2])
+
+            # Fresh instance, as segment rows are cached on the source between calls
+            source = TranslationSource.objects.get(pk=self.source.pk)
+
+            with self.subTest(count=count):
+                if expected_queries is None:
+                    with CaptureQueriesContext(connection) as queries:
+                        segments = source._get_segments_for_translation(
+                            self.target_locale, fallback=True
+                        )
+                    expected_queries = len(queries.captured_queries)
+                else:
+                    with self.assertNumQueries(expected_queries):
+                        segments = source._get_segments_for_translation(
+                            self.target_locale, fallback=True
+                        )
+
+                values = {s.string.data for s in segments if hasattr(s, "string")}
+                assert f"scaled source {created - 1}" in values
+                assert DO_NOT_TRANSLATE_MARKER not in values
+
     @override_settings(WAGTAIL_LOCALIZE_INTENTIONAL_BLANKS_ENABLED=False)
     def test_patch_disabled_when_feature_disabled(self):
         """Test that patch does not apply when feature is disabled."""
@@ -337,11 +433,7 @@ class TestPatchFunctionality(TestCase):
 
         # With feature disabled, the patch is bypassed and markers are NOT replaced
         # Since a translation exists (the marker), wagtail-localize returns it as-is
-        # Note: We use fallback=True to handle the page's auto-created segments
-        segments = self.source._get_segments_for_translation(
-            self.target_locale, fallback=True
-        )
-        string_segments = [s for s in segments if hasattr(s, "string")]
+        string_segments = self._string_segments()
 
         # Verify that the marker is NOT replaced (feature is disabled)
         found_marker = False
@@ -352,6 +444,64 @@ class TestPatchFunctionality(TestCase):
 
         assert found_marker, "With feature disabled, marker should NOT be replaced"
 
+    def test_patch_picks_up_setting_changes(self):
+        """Test that cached settings are refreshed when the settings change."""
+        string = String.objects.create(data="Cached Source", locale=self.source_locale)
+        context_obj, _ = TranslationContext.objects.get_or_create(
+            path="test.cached_field", defaults={"object": self.source.object}
+        )
+        segment = StringSegment.objects.create(
+            source=self.source,
+            string=string,
+            context=context_obj,
+            order=0,
+            attrs="{}",
+        )
+        mark_segment_do_not_translate(self.translation, segment)
+
+        def segment_values():
+            return {s.string.data for s in self._string_segments()}
+
+        assert "Cached Source" in segment_values()
+
+        with override_settings(WAGTAIL_LOCALIZE_INTENTIONAL_BLANKS_ENABLED=False):
+            assert DO_NOT_TRANSLATE_MARKER in segment_values()
+
+        assert "Cached Source" in segment_values()
+
+    def test_patch_caches_locale_independent_segments(self):
+        """Test that template/related object rows are reused across target locales."""
+        german_locale = Locale.objects.get_or_create(language_code="de")[0]
+        template = Template.objects.create(
+            uuid=uuid.uuid4(),
+            template_format="html",
+            template="<p>cached</p>",
+            string_count=0,
+        )
+        context_obj, _ = TranslationContext.objects.get_or_create(
+            path="test.cached_template", defaults={"object": self.source.object}
+        )
+        TemplateSegment.objects.create(
+            source=self.source, template=template, context=context_obj, order=50
+        )
+
+        with CaptureQueriesContext(connection) as first:
+            self.source._get_segments_for_translation(self.target_locale, fallback=True)
+        with CaptureQueriesContext(connection) as second:
+            segments = self.source._get_segments_for_translation(
+                german_locale, fallback=True
+            )
+
+        # Template and related object segments aren't queried again
+        assert len(second.captured_queries) == len(first.captured_queries) - 2
+        assert any(getattr(s, "template", None) == "<p>cached</p>" for s in segments)
+
+        # Refreshing the source's segments drops the cache
+        self.source.refresh_segments()
+        with CaptureQueriesContext(connection) as after_refresh:
+            self.source._get_segments_for_translation(german_locale, fallback=True)
+        assert len(after_refresh.captured_queries) == len(first.captured_queries)
+
     def test_patch_handles_empty_translation_source(self):
         """Test that patch handles pages with no string segments gracefully."""
         # Create a minimal page with no additional content
@@ -384,31 +534,15 @@ class TestPatchFunctionality(TestCase):
             ("third", 2),
         ]
 
-        for text, order in segment_data:
-            string = String.objects.create(
-                data=text,
-                locale=self.source_locale,
-            )
-            context_obj, _ = TranslationContext.objects.get_or_create(
-                path=f"test.order_field_{order}",
-                defaults={"object": self.source.object},
-            )
-            segment = StringSegment.objects.create(
-                source=self.source,
-                string=string,
-                context=context_obj,
-                order=order,
-                attrs="{}",
-            )
-            # Mark all as do not translate
+        created_segments = self._bulk_create_string_segments(
+            [(text, f"test.order_field_{order}", order) for text, order in segment_data]
+        )
+        # Mark all as do not translate
+        for segment in created_segments:
             mark_segment_do_not_translate(self.translation, segment)
 
         # Get segments
-        # Use fallback=True to handle automatically created page segments (title, slug, etc)
-        segments = self.source._get_segments_for_translation(
-            self.target_locale, fallback=True
-        )
-        string_segments = [s for s in segments if hasattr(s, "string")]
+        string_segments = self._string_segments()
 
         # Verify we got segments back
         assert len(string_segments) >= 3, "Should have at least 3 string segments"
@@ -590,6 +724,55 @@ class TestPatchFunctionality(TestCase):
         related_seg = related_fallback_segments[0]
         assert related_seg.data == target_page.pk
 
+    def test_patch_related_object_lookups_do_not_scale_with_segments(self):
+        """Test that related object locale lookups are batched, not issued per segment."""
+        page_ct = ContentType.objects.get_for_model(Page)
+
+        def add_related_segments(count, offset):
+            for i in range(offset, offset + count):
+                related_page = Page(
+                    title=f"Related {i}", slug=f"related-{i}", locale=self.source_locale
+                )
+                self.root_page.add_child(instance=related_page)
+                if i % 2:
+                    related_page.copy_for_translation(self.target_locale)
+                translatable_obj = TranslatableObject.objects.get_or_create(
+                    content_type=page_ct, translation_key=related_page.translation_key
+                )[0]
+                context_obj, _ = TranslationContext.objects.get_or_create(
+                    path=f"test.related_many_{i}",
+                    defaults={"object": self.source.object},
+                )
+                RelatedObjectSegment.objects.create(
+                    source=self.source,
+                    object=translatable_obj,
+                    context=context_obj,
+                    order=1000 + i,
+                )
+
+        add_related_segments(2, 0)
+        with CaptureQueriesContext(connection) as few:
+            self.source._get_segments_for_translation(self.target_locale, fallback=True)
+
+        add_related_segments(6, 2)
+        # Fresh instance, as segment rows are cached on the source between calls
+        source = TranslationSource.objects.get(pk=self.source.pk)
+        with CaptureQueriesContext(connection) as many:
+            segments = source._get_segments_for_translation(
+                self.target_locale, fallback=True
+            )
+
+        assert len(many.captured_queries) == len(few.captured_queries)
+
+        related_paths = {
+            s.path
+            for s in segments
+            if s.__class__.__name__
+            in ("RelatedObjectSegmentValue", "OverridableSegmentValue")
+            and s.path.startswith("test.related_many_")
+        }
+        assert len(related_paths) == 8
+
     def test_patch_handles_overridable_segments(self):
         """Test that patch correctly processes overridable segments."""
         # Create an overridable segment with a JSON object
@@ -798,8 +981,8 @@ class TestPatchFunctionality(TestCase):
         )
 
         # Step 2: Find the title_field segment and mark it as Do Not Translate
-        title_field_segment = StringSegment.objects.get(
-            source=test_source, context__path="title_field"
+        title_field_segment = self._segments_qs(test_source).get(
+            context__path="title_field"
         )
 
         mark_segment_do_not_translate(
@@ -844,8 +1027,8 @@ class TestPatchFunctionality(TestCase):
 
         # Step 5: Verify the marker was migrated to the new String
         # Get the title_field segment after refresh
-        title_field_segment_after = StringSegment.objects.get(
-            source=test_source, context__path="title_field"
+        title_field_segment_after = self._segments_qs(test_source).get(
+            context__path="title_field"
         )
 
         # The String should have changed (new content)
@@ -877,10 +1060,7 @@ class TestPatchFunctionality(TestCase):
         )
 
         # Step 7: Verify the field renders with the NEW source value
-        segments = test_source._get_segments_for_translation(
-            self.target_locale, fallback=True
-        )
-        string_segments = [s for s in segments if hasattr(s, "string")]
+        string_segments = self._string_segments(test_source)
         assert any(
             s.string.data == "Updated Title Field Content" for s in string_segments
         ), "Field should render with new source value when marked as Do Not Translate"
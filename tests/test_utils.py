@@ -19,14 +19,18 @@ from wagtail_localize_intentional_blanks.constants import (
     BACKUP_SEPARATOR,
     DO_NOT_TRANSLATE_MARKER,
 )
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from django.db import connection
+from django.db.models import QuerySet
 from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext
 
 from wagtail_localize_intentional_blanks.utils import (
     bulk_mark_segments,
     bulk_unmark_segments,
     get_marker,
+    get_marker_prefix,
     get_segments_do_not_translate,
     get_source_fallback_stats,
     is_do_not_translate,
@@ -99,6 +103,20 @@ class TestUtilsFunctions(TestCase):
         marker = get_marker()
         assert marker == DO_NOT_TRANSLATE_MARKER
 
+    def test_get_marker_follows_setting_changes(self):
+        """Test that the cached marker values are refreshed when settings change."""
+        assert get_marker_prefix() == DO_NOT_TRANSLATE_MARKER + BACKUP_SEPARATOR
+
+        with override_settings(
+            WAGTAIL_LOCALIZE_INTENTIONAL_BLANKS_MARKER="__CUSTOM__",
+            WAGTAIL_LOCALIZE_INTENTIONAL_BLANKS_BACKUP_SEPARATOR="::",
+        ):
+            assert get_marker() == "__CUSTOM__"
+            assert get_marker_prefix() == "__CUSTOM__::"
+
+        assert get_marker() == DO_NOT_TRANSLATE_MARKER
+        assert get_marker_prefix() == DO_NOT_TRANSLATE_MARKER + BACKUP_SEPARATOR
+
     def test_mark_segment_do_not_translate_creates_translation(self):
         """Test marking a segment creates a StringTranslation."""
         result = mark_segment_do_not_translate(
@@ -146,6 +164,100 @@ class TestUtilsFunctions(TestCase):
         ).count()
         assert count == 1
 
+    def test_mark_segment_do_not_translate_twice_keeps_backup(self):
+        """Test marking an already marked segment keeps the original backup."""
+        StringTranslation.objects.create(
+            translation_of=self.string,
+            locale=self.target_locale,
+            context=self.segment.context,
+            data="Original translation",
+        )
+
+        mark_segment_do_not_translate(self.translation, self.segment)
+        mark_segment_do_not_translate(self.translation, self.segment, user=self.user)
+
+        st = StringTranslation.objects.get(
+            translation_of=self.string,
+            locale=self.target_locale,
+            context=self.segment.context,
+        )
+        assert (
+            st.data
+            == f"{DO_NOT_TRANSLATE_MARKER}{BACKUP_SEPARATOR}Original translation"
+        )
+        assert st.last_translated_by == self.user
+
+    def test_mark_segment_do_not_translate_single_select(self):
+        """Test marking issues one SELECT when the segment's relations are loaded."""
+        segment = StringSegment.objects.select_related("string", "context").get(
+            pk=self.segment.pk
+        )
+
+        def count_selects():
+            return sum(q["sql"].startswith("SELECT") for q in ctx.captured_queries)
+
+        # New row
+        with CaptureQueriesContext(connection) as ctx:
+            mark_segment_do_not_translate(self.translation, segment)
+        assert count_selects() == 1
+
+        # Existing row with a translation to back up
+        StringTranslation.objects.filter(translation_of=self.string).update(
+            data="Original translation"
+        )
+        segment = StringSegment.objects.select_related("string", "context").get(
+            pk=self.segment.pk
+        )
+        with CaptureQueriesContext(connection) as ctx:
+            mark_segment_do_not_translate(self.translation, segment)
+        assert count_selects() == 1
+
+    def test_mark_segment_do_not_translate_lock_without_for_update_of(self):
+        """Test the row lock skips FOR UPDATE OF where the backend lacks it (MariaDB)."""
+        original = QuerySet.select_for_update
+
+        for supported, expected_of in ((True, ("self",)), (False, ())):
+            with (
+                self.subTest(has_select_for_update_of=supported),
+                patch.object(
+                    connection.features, "has_select_for_update_of", supported
+                ),
+                patch.object(
+                    QuerySet,
+                    "select_for_update",
+                    autospec=True,
+                    side_effect=original,
+                ) as select_for_update,
+            ):
+                result = mark_segment_do_not_translate(self.translation, self.segment)
+
+            assert select_for_update.call_args.kwargs["of"] == expected_of
+            assert result.data == DO_NOT_TRANSLATE_MARKER
+
+    def test_mark_segment_do_not_translate_handles_concurrent_create(self):
+        """Test a row created by a concurrent request is marked instead of failing."""
+        StringTranslation.objects.create(
+            translation_of=self.string,
+            locale=self.target_locale,
+            context=self.segment.context,
+            data="Original translation",
+        )
+
+        # Simulate the other request inserting between our lookup and create
+        with patch.object(QuerySet, "first", return_value=None):
+            result = mark_segment_do_not_translate(self.translation, self.segment)
+
+        assert (
+            result.data
+            == f"{DO_NOT_TRANSLATE_MARKER}{BACKUP_SEPARATOR}Original translation"
+        )
+        assert (
+            StringTranslation.objects.filter(
+                translation_of=self.string, locale=self.target_locale
+            ).count()
+            == 1
+        )
+
     def test_unmark_segment_do_not_translate_without_backup(self):
         """Test unmarking a segment without backup deletes it."""
         # First mark it (no existing translation, so no backup)
@@ -190,8 +302,19 @@ class TestUtilsFunctions(TestCase):
             == f"{DO_NOT_TRANSLATE_MARKER}{BACKUP_SEPARATOR}Original translation"
         )
 
-        # Unmark it
-        result = unmark_segment_do_not_translate(self.translation, self.segment)
+        # Unmark it: one SELECT for the marked translation, then the UPDATE.
+        # wagtail-localize's post_save handler may also write the page's draft
+        # title, depending on the segment, so only StringTranslation queries count.
+        with CaptureQueriesContext(connection) as ctx:
+            result = unmark_segment_do_not_translate(self.translation, self.segment)
+        string_translation_queries = [
+            q["sql"].split(" ", 1)[0]
+            for q in ctx.captured_queries
+            if '"wagtail_localize_stringtranslation"' in q["sql"]
+        ]
+        assert string_translation_queries == ["SELECT", "UPDATE"]
+        # No lazy loads of the String or context
+        assert sum(q["sql"].startswith("SELECT") for q in ctx.captured_queries) == 1
 
         # Should return 1 (updated)
         assert result == 1
@@ -243,6 +366,17 @@ class TestUtilsFunctions(TestCase):
 
         assert is_do_not_translate(string_translation) is False
 
+    def test_is_do_not_translate_returns_false_for_marker_lookalike(self):
+        """Test is_do_not_translate returns False when data only starts with the marker."""
+        string_translation = StringTranslation.objects.create(
+            translation_of=self.string,
+            locale=self.target_locale,
+            context=self.segment.context,
+            data=f"{DO_NOT_TRANSLATE_MARKER} and more text",
+        )
+
+        assert is_do_not_translate(string_translation) is False
+
     def test_get_source_fallback_stats_all_marked(self):
         """Test get_source_fallback_stats when all segments are marked."""
         # Create and mark segments
@@ -301,7 +435,9 @@ class TestUtilsFunctions(TestCase):
                 data=f"Translation {i}",
             )
 
-        stats = get_source_fallback_stats(self.translation)
+        # All three counts come from one aggregate query
+        with self.assertNumQueries(1):
+            stats = get_source_fallback_stats(self.translation)
 
         assert stats["total"] == 5
         assert stats["do_not_translate"] == 2
@@ -348,6 +484,80 @@ class TestUtilsFunctions(TestCase):
             assert st.data == DO_NOT_TRANSLATE_MARKER
             assert st.last_translated_by == self.user
 
+    def test_bulk_mark_segments_keeps_existing_backup(self):
+        """Test bulk marking an already marked segment keeps the original backup."""
+        StringTranslation.objects.create(
+            translation_of=self.string,
+            locale=self.target_locale,
+            context=self.segment.context,
+            data="Original translation",
+        )
+        mark_segment_do_not_translate(self.translation, self.segment)
+
+        count = bulk_mark_segments(self.translation, [self.segment], user=self.user)
+
+        assert count == 1
+        st = StringTranslation.objects.get(
+            translation_of=self.string, locale=self.target_locale
+        )
+        assert (
+            st.data
+            == f"{DO_NOT_TRANSLATE_MARKER}{BACKUP_SEPARATOR}Original translation"
+        )
+        assert st.last_translated_by == self.user
+
+    def test_bulk_mark_segments_does_not_load_contexts(self):
+        """Test that bulk_mark_segments doesn't lazy-load contexts per segment."""
+        for i in range(6):
+            string = String.objects.create(
+                data=f"Context string {i}",
+                locale=self.source_locale,
+            )
+            context_obj, _ = TranslationContext.objects.get_or_create(
+                path=f"test.bulk_context_{i}", defaults={"object": self.source.object}
+            )
+            StringSegment.objects.create(
+                source=self.source,
+                string=string,
+                context=context_obj,
+                order=i + 1,
+            )
+            if i % 2:
+                StringTranslation.objects.create(
+                    translation_of=string,
+                    locale=self.target_locale,
+                    context=context_obj,
+                    data=f"Translation {i}",
+                )
+
+        # Fresh instances, so any access to segment.context would hit the database
+        segments = list(
+            StringSegment.objects.filter(
+                source=self.source, context__path__startswith="test.bulk_context_"
+            )
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            count = bulk_mark_segments(self.translation, segments, user=self.user)
+
+        assert count == 6
+        # SELECT existing (joined with context) and SELECT contexts for new
+        # translations; the writes depend on whether the backend can upsert
+        selects = [q for q in ctx.captured_queries if q["sql"].startswith("SELECT")]
+        assert len(selects) == 2
+
+        translations = StringTranslation.objects.filter(
+            locale=self.target_locale,
+            context__path__startswith="test.bulk_context_",
+        ).order_by("context__path")
+        assert [st.data for st in translations] == [
+            DO_NOT_TRANSLATE_MARKER
+            if i % 2 == 0
+            else f"{DO_NOT_TRANSLATE_MARKER}{BACKUP_SEPARATOR}Translation {i}"
+            for i in range(6)
+        ]
+        assert all(st.last_translated_by == self.user for st in translations)
+
     def test_bulk_mark_segments_empty_list(self):
         """Test bulk_mark_segments with empty list."""
         count = bulk_mark_segments(self.translation, [], user=self.user)
@@ -462,6 +672,28 @@ class TestUtilsFunctions(TestCase):
             )
             assert segment_data[segment.id]["source_value"] == segment.string.data
 
+    @override_settings(WAGTAIL_LOCALIZE_INTENTIONAL_BLANKS_BACKUP_SEPARATOR="_")
+    def test_bulk_unmark_segments_separator_inside_marker(self):
+        """Test the backup is restored when the marker itself contains the separator."""
+        StringTranslation.objects.create(
+            translation_of=self.string,
+            locale=self.target_locale,
+            context=self.segment.context,
+            data="Original translation",
+        )
+        mark_segment_do_not_translate(self.translation, self.segment)
+
+        count, segment_data = bulk_unmark_segments(self.translation, [self.segment])
+
+        assert count == 1
+        st = StringTranslation.objects.get(
+            translation_of=self.string, locale=self.target_locale
+        )
+        assert st.data == "Original translation"
+        assert (
+            segment_data[self.segment.id]["translated_value"] == "Original translation"
+        )
+
     def test_bulk_unmark_segments_mixed(self):
         """Test bulk_unmark_segments with a mix of segments with and without backups."""
         segments = []
@@ -792,6 +1024,9 @@ class TestUtilsFunctions(TestCase):
             )
             assert updated_count == 1, f"Expected 1 updated signal, got {updated_count}"
 
+            # Handlers receive saved instances, including for newly created rows
+            assert all(call.kwargs["instance"].pk is not None for call in calls)
+
         finally:
             # Clean up signal handler
             post_save.disconnect(signal_handler, sender=StringTranslation)
@@ -1158,6 +1393,19 @@ class TestValidateConfiguration(TestCase):
         # Should not raise any exception
         validate_configuration()
 
+    def test_validate_configuration_rechecks_after_setting_change(self):
+        """Test that validation reflects setting changes after a successful check."""
+        validate_configuration()
+
+        with (
+            override_settings(WAGTAIL_LOCALIZE_INTENTIONAL_BLANKS_MARKER=""),
+            pytest.raises(ValueError),
+        ):
+            validate_configuration()
+
+        # Valid again once the override is removed
+        validate_configuration()
+
     @override_settings(WAGTAIL_LOCALIZE_INTENTIONAL_BLANKS_MARKER=None)
     def test_validate_configuration_raises_when_marker_is_none(self):
         """Test that validate_configuration raises ValueError when MARKER is None."""
@@ -6,7 +6,9 @@ import json
 
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import connection
 from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from wagtail.models import Locale, Page
 from wagtail_localize.models import (
@@ -95,6 +97,27 @@ class TestMarkSegmentView(TestCase):
         # Should redirect to login
         assert response.status_code == 302
 
+    def test_mark_segment_loads_context_with_segment(self):
+        """Test that a first-time mark doesn't lazy-load the segment's context."""
+        self.client.login(username="testuser", password="testpass")
+
+        url = reverse(
+            "wagtail_localize_intentional_blanks:mark_segment_do_not_translate",
+            args=[self.translation.id, self.segment.id],
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.post(url, {"do_not_translate": "true"})
+
+        assert response.status_code == 200
+        context_queries = [
+            q["sql"]
+            for q in ctx.captured_queries
+            if q["sql"].startswith("SELECT")
+            and 'FROM "wagtail_localize_translationcontext"' in q["sql"]
+        ]
+        assert context_queries == []
+
     def test_mark_segment_requires_post(self):
         """Test that marking requires POST method."""
         self.client.login(username="testuser", password="testpass")
@@ -459,6 +482,58 @@ class TestGetSegmentStatusView(TestCase):
         assert data["do_not_translate"] is False
         assert data["translated_text"] == "French translation"
 
+    def test_get_status_uses_segment_context(self):
+        """Test that a translation of the same string in another context is ignored."""
+        self.client.login(username="testuser", password="testpass")
+
+        other_context, _ = TranslationContext.objects.get_or_create(
+            path="test.other_field", defaults={"object": self.source.object}
+        )
+        StringTranslation.objects.create(
+            translation_of=self.string,
+            locale=self.target_locale,
+            context=other_context,
+            data=DO_NOT_TRANSLATE_MARKER,
+        )
+        StringTranslation.objects.create(
+            translation_of=self.string,
+            locale=self.target_locale,
+            context=self.segment.context,
+            data="French translation",
+        )
+
+        url = reverse(
+            "wagtail_localize_intentional_blanks:get_segment_status",
+            args=[self.translation.id, self.segment.id],
+        )
+
+        response = self.client.get(url)
+
+        assert response.status_code == 200
+        data = json.loads(response.content)
+
+        assert data["do_not_translate"] is False
+        assert data["translated_text"] == "French translation"
+
+    def test_get_status_loads_segment_with_string(self):
+        """Test that the segment and its String are fetched in one query."""
+        self.client.login(username="testuser", password="testpass")
+
+        url = reverse(
+            "wagtail_localize_intentional_blanks:get_segment_status",
+            args=[self.translation.id, self.segment.id],
+        )
+
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url)
+
+        assert response.status_code == 200
+        localize_queries = [
+            q["sql"] for q in ctx.captured_queries if '"wagtail_localize_' in q["sql"]
+        ]
+        # Translation, StringSegment (+ String), StringTranslation
+        assert len(localize_queries) == 3
+
     def test_get_status_invalid_ids(self):
         """Test getting status with invalid IDs."""
         self.client.login(username="testuser", password="testpass")
@@ -2,6 +2,11 @@
 Constants used throughout the library.
 """
 
+from functools import cache
+
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
 # The marker value stored in StringTranslation.data to indicate "do not translate"
 DO_NOT_TRANSLATE_MARKER = "__DO_NOT_TRANSLATE__"
 
@@ -42,3 +47,20 @@ def get_setting(key, default=None):
 
     full_key = f"{SETTINGS_PREFIX}_{key}"
     return getattr(settings, full_key, DEFAULTS.get(key, default))
+
+
+@cache
+def get_cached_setting(key):
+    """
+    Get a setting value like get_setting(), caching it until our settings change.
+
+    Use this for settings read on every request or patched call.
+    """
+    return get_setting(key)
+
+
+@receiver(setting_changed)
+def _clear_cached_settings(setting, **kwargs):
+    """Drop cached setting values when one of our settings changes."""
+    if setting.startswith(SETTINGS_PREFIX):
+        get_cached_setting.cache_clear()
@@ -8,8 +8,10 @@ when the marker is present.
 
 import json
 import logging
+from collections import defaultdict
 
-from wagtail_localize.models import TranslationSource
+from django.contrib.contenttypes.models import ContentType
+from wagtail_localize.models import TranslationSource, pk
 from wagtail_localize.segments import (
     OverridableSegmentValue,
     RelatedObjectSegmentValue,
@@ -18,7 +20,8 @@ from wagtail_localize.segments import (
 )
 from wagtail_localize.strings import StringValue
 
-from .constants import get_setting
+from .constants import get_cached_setting
+from .utils import get_marker, get_marker_prefix
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +29,71 @@ logger = logging.getLogger(__name__)
 _original_get_segments_for_translation = TranslationSource._get_segments_for_translation
 
 
+def _get_instance_pks(translatable_objects, locale):
+    """
+    Look up the instances of several TranslatableObjects in a locale at once.
+
+    This replaces per-object has_translation()/get_instance() calls with one
+    query per content type.
+
+    Args:
+        translatable_objects: Iterable of TranslatableObject instances
+        locale: Locale instance or ID
+
+    Returns:
+        dict mapping (content_type_id, translation_key) -> instance pk for the
+        objects that exist in the locale
+    """
+    keys_by_content_type = defaultdict(set)
+    for translatable_object in translatable_objects:
+        keys_by_content_type[translatable_object.content_type_id].add(
+            translatable_object.translation_key
+        )
+
+    instance_pks = {}
+    for content_type_id, translation_keys in keys_by_content_type.items():
+        content_type = ContentType.objects.get_for_id(content_type_id)
+        rows = content_type.get_all_objects_for_this_type(
+            translation_key__in=translation_keys, locale_id=pk(locale)
+        ).values_list("translation_key", "pk")
+        for translation_key, instance_pk in rows:
+            instance_pks[(content_type_id, translation_key)] = instance_pk
+
+    return instance_pks
+
+
+# Name of the per-instance cache of locale-independent segment rows
+_SEGMENT_CACHE_ATTR = "_intentional_blanks_segment_cache"
+
+
+def _get_cached_segments(source, kind):
+    """
+    Get a source's template or related object segments, cached on the instance.
+
+    These rows don't depend on the target locale, so when the same
+    TranslationSource is rendered into several locales only the first call
+    queries them. The cache is dropped whenever the source's segments are
+    refreshed (see _refresh_segments_with_cache_reset).
+
+    Args:
+        source: TranslationSource instance
+        kind: "template" or "related_object"
+
+    Returns:
+        list of TemplateSegment or RelatedObjectSegment instances
+    """
+    cache = source.__dict__.setdefault(_SEGMENT_CACHE_ATTR, {})
+    if kind not in cache:
+        if kind == "template":
+            queryset = source.templatesegment_set.select_related("template", "context")
+        else:
+            queryset = source.relatedobjectsegment_set.select_related(
+                "object", "context"
+            )
+        cache[kind] = list(queryset)
+    return cache[kind]
+
+
 def _get_segments_for_translation_with_intentional_blanks(self, locale, fallback=False):
     """
     Enhanced version of _get_segments_for_translation that handles intentional blanks.
@@ -36,12 +104,12 @@ def _get_segments_for_translation_with_intentional_blanks(self, locale, fallback
 
     This works correctly for all field types including multi-segment RichTextField.
     """
-    if not get_setting("ENABLED"):
+    if not get_cached_setting("ENABLED"):
         # Feature disabled, use original implementation
         return _original_get_segments_for_translation(self, locale, fallback)
 
-    marker = get_setting("MARKER")
-    backup_separator = get_setting("BACKUP_SEPARATOR")
+    marker = get_marker()
+    marker_prefix = get_marker_prefix()
 
     # Import here to avoid circular imports
     from wagtail_localize.models import MissingTranslationError, StringSegment
@@ -59,13 +127,17 @@ def _get_segments_for_translation_with_intentional_blanks(self, locale, fallback
             # Check if this translation is marked as "do not translate"
             translation_data = string_segment.translation
 
-            # Check for marker (exact match or with encoded backup)
-            if translation_data == marker or translation_data.startswith(
-                marker + backup_separator
+            # Check for marker (exact match or with encoded backup). The startswith()
+            # gate rejects ordinary translations with a single comparison, and the
+            # encoded backup is never parsed since the source value is used instead.
+            if translation_data.startswith(marker) and (
+                translation_data == marker or translation_data.startswith(marker_prefix)
             ):
                 # Use source value instead of translation
                 logger.debug(
-                    f"Intentional blank detected for segment {string_segment.string_id} in locale {locale}, using source value"
+                    "Intentional blank detected for segment %s in locale %s, using source value",
+                    string_segment.string_id,
+                    locale,
                 )
                 string = StringValue(string_segment.string.data)
             else:
@@ -85,8 +157,7 @@ def _get_segments_for_translation_with_intentional_blanks(self, locale, fallback
         segments.append(segment_value)
 
     # Handle template segments (templates are locale-independent)
-    template_segments = self.templatesegment_set.all().select_related("template")
-    for template_segment in template_segments:
+    for template_segment in _get_cached_segments(self, "template"):
         segment_value = TemplateSegmentValue(
             template_segment.context.path,
             template_segment.template.template_format,
@@ -97,30 +168,43 @@ def _get_segments_for_translation_with_intentional_blanks(self, locale, fallback
         segments.append(segment_value)
 
     # Handle related object segments
-    related_object_segments = self.relatedobjectsegment_set.all().select_related(
-        "object"
-    )
+    related_object_segments = _get_cached_segments(self, "related_object")
+    translatable_objects = [segment.object for segment in related_object_segments]
+    target_pks = _get_instance_pks(translatable_objects, locale)
+    source_pks = None
+
     for related_object_segment in related_object_segments:
-        if related_object_segment.object.has_translation(locale):
+        translatable_object = related_object_segment.object
+        content_type = ContentType.objects.get_for_id(
+            translatable_object.content_type_id
+        )
+        key = (translatable_object.content_type_id, translatable_object.translation_key)
+
+        if key in target_pks:
             # Object exists in target locale - use RelatedObjectSegmentValue
             segment_value = RelatedObjectSegmentValue(
                 related_object_segment.context.path,
-                related_object_segment.object.content_type,
-                related_object_segment.object.translation_key,
+                content_type,
+                translatable_object.translation_key,
             ).with_order(related_object_segment.order)
             segments.append(segment_value)
         elif fallback:
             # Object doesn't exist in target locale - fall back to source locale object
             # Use OverridableSegmentValue to reference by PK without locale lookup
-            source_instance = related_object_segment.object.get_instance(self.locale)
+            if source_pks is None:
+                source_pks = _get_instance_pks(translatable_objects, self.locale_id)
+            if key not in source_pks:
+                raise content_type.model_class().DoesNotExist(
+                    f"Related object {translatable_object} does not exist in locale {self.locale}"
+                )
             segment_value = OverridableSegmentValue(
                 related_object_segment.context.path,
-                source_instance.pk,
+                source_pks[key],
             ).with_order(related_object_segment.order)
             segments.append(segment_value)
         else:
-            raise related_object_segment.object.content_type.model_class().DoesNotExist(
-                f"Related object {related_object_segment.object} does not exist in locale {locale}"
+            raise content_type.model_class().DoesNotExist(
+                f"Related object {translatable_object} does not exist in locale {locale}"
             )
 
     # Handle overridable segments
@@ -168,6 +252,9 @@ def apply_patch():
     # make sure that the field remains marked as 'Do Not Translate'.
     _patch_update_from_db()
 
+    # Drop cached segment rows whenever a source's segments are rebuilt
+    _patch_refresh_segments()
+
 
 # Store the original update_from_db method
 _original_update_from_db = TranslationSource.update_from_db
@@ -183,7 +270,7 @@ def _update_from_db_with_marker_migration(self):
     # Call the original method to perform the update
     result = _original_update_from_db(self)
 
-    if not get_setting("ENABLED"):
+    if not get_cached_setting("ENABLED"):
         return result
 
     # After updating, migrate any orphaned markers for all target locales
@@ -202,3 +289,18 @@ def _update_from_db_with_marker_migration(self):
 def _patch_update_from_db():
     """Patch the update_from_db method to migrate markers after sync."""
     TranslationSource.update_from_db = _update_from_db_with_marker_migration
+
+
+# Store the original refresh_segments method
+_original_refresh_segments = TranslationSource.refresh_segments
+
+
+def _refresh_segments_with_cache_reset(self):
+    """Refresh the source's segments, dropping any cached segment rows first."""
+    self.__dict__.pop(_SEGMENT_CACHE_ATTR, None)
+    return _original_refresh_segments(self)
+
+
+def _patch_refresh_segments():
+    """Patch the refresh_segments method to reset the segment cache."""
+    TranslationSource.refresh_segments = _refresh_segments_with_cache_reset
@@ -4,19 +4,25 @@ Utility functions for marking segments as "do not translate".
 
 import logging
 
-from django.db import transaction
-from django.db.models import Q
+import django
+from django.db import IntegrityError, connections, router, transaction
+from django.db.models import Count, Q
+from django.db.models.functions import Substr
 from django.db.models.signals import post_save
-from wagtail_localize.models import StringSegment, StringTranslation
+from wagtail_localize.models import (
+    StringSegment,
+    StringTranslation,
+    TranslationContext,
+)
 
-from .constants import get_setting
+from .constants import get_cached_setting
 
 logger = logging.getLogger(__name__)
 
 
 def get_marker():
     """Get the configured marker value."""
-    return get_setting("MARKER")
+    return get_cached_setting("MARKER")
 
 
 def get_backup_separator():
@@ -27,7 +33,16 @@ def get_backup_separator():
     Format: MARKER + BACKUP_SEPARATOR + original_value
     Example: "__DO_NOT_TRANSLATE__|backup|original_value"
     """
-    return get_setting("BACKUP_SEPARATOR")
+    return get_cached_setting("BACKUP_SEPARATOR")
+
+
+def get_marker_prefix():
+    """
+    Get the prefix of a marker with an encoded backup (MARKER + BACKUP_SEPARATOR).
+
+    Only call this after validate_configuration(), as it assumes both values are set.
+    """
+    return get_marker() + get_backup_separator()
 
 
 def validate_configuration():
@@ -73,43 +88,86 @@ def mark_segment_do_not_translate(translation, segment, user=None):
     marker = get_marker()
 
     logger.info(
-        f"Marking segment: string_id={segment.string.id}, locale={translation.target_locale}, context='{segment.context}', marker='{marker}'"
+        "Marking segment: string_id=%s, locale_id=%s, context_id=%s, marker=%r",
+        segment.string_id,
+        translation.target_locale_id,
+        segment.context_id,
+        marker,
     )
 
-    # Check if there's an existing translation with real data (not the marker)
-    backup_separator = get_backup_separator()
-    try:
-        existing = StringTranslation.objects.get(
-            translation_of=segment.string,
-            locale=translation.target_locale,
-            context=segment.context,
+    marker_prefix = get_marker_prefix()
+    # Lock only the StringTranslation row, not the joined String and context,
+    # where the backend supports it (MariaDB doesn't support FOR UPDATE OF)
+    db_features = connections[router.db_for_write(StringTranslation)].features
+    existing_translations = (
+        StringTranslation.objects.select_for_update(
+            of=("self",) if db_features.has_select_for_update_of else ()
         )
-        # Encode backup in the marker itself
-        if existing.data != marker and not existing.data.startswith(
-            marker + backup_separator
-        ):
-            backup_data = existing.data
-            logger.info(f"Backing up existing translation: '{backup_data}'")
-            # Encode backup in the data field: __DO_NOT_TRANSLATE__|backup|original_value
-            marker_with_backup = f"{marker}{backup_separator}{backup_data}"
-        else:
-            marker_with_backup = marker
-    except StringTranslation.DoesNotExist:
-        marker_with_backup = marker
-
-    string_translation, created = StringTranslation.objects.update_or_create(
-        translation_of=segment.string,
-        locale=translation.target_locale,
-        context=segment.context,
-        defaults={
-            "data": marker_with_backup,
-            "translation_type": StringTranslation.TRANSLATION_TYPE_MANUAL,
-            "last_translated_by": user,
-        },
+        .filter(
+            translation_of_id=segment.string_id,
+            locale_id=translation.target_locale_id,
+            context_id=segment.context_id,
+        )
+        # StringTranslation.save() reads translation_of and wagtail-localize's
+        # post_save handler reads the context
+        .select_related("translation_of", "context")
     )
 
+    with transaction.atomic():
+        # Lock the existing row (if any) so the backup is computed from the
+        # data we overwrite, then write it back without a second lookup
+        string_translation = existing_translations.first()
+        created = False
+
+        if string_translation is None:
+            try:
+                with transaction.atomic():
+                    # Pass the loaded String and context so save() and
+                    # post_save don't fetch them again
+                    string_translation = StringTranslation.objects.create(
+                        translation_of=segment.string,
+                        locale_id=translation.target_locale_id,
+                        context=segment.context,
+                        data=marker,
+                        translation_type=StringTranslation.TRANSLATION_TYPE_MANUAL,
+                        last_translated_by=user,
+                    )
+                created = True
+            except IntegrityError:
+                # Another request created the row first, mark that one instead
+                string_translation = existing_translations.get()
+
+        if not created:
+            if string_translation.data == marker or string_translation.data.startswith(
+                marker_prefix
+            ):
+                # Already marked, keep any backup that is already encoded
+                marker_with_backup = string_translation.data
+            else:
+                # Existing translation with real data (not the marker)
+                backup_data = string_translation.data
+                logger.info("Backing up existing translation: %r", backup_data)
+                # Encode backup in the data field: __DO_NOT_TRANSLATE__|backup|original_value
+                marker_with_backup = f"{marker_prefix}{backup_data}"
+
+            string_translation.data = marker_with_backup
+            string_translation.translation_type = (
+                StringTranslation.TRANSLATION_TYPE_MANUAL
+            )
+            string_translation.last_translated_by = user
+            string_translation.save(
+                update_fields=[
+                    "data",
+                    "translation_type",
+                    "last_translated_by",
+                    "updated_at",
+                ]
+            )
+
     logger.info(
-        f"StringTranslation {'created' if created else 'updated'}: id={string_translation.id}"
+        "StringTranslation %s: id=%s",
+        "created" if created else "updated",
+        string_translation.id,
     )
 
     return string_translation
@@ -131,67 +189,50 @@ def unmark_segment_do_not_translate(translation, segment):
     """
     validate_configuration()
     marker = get_marker()
-    backup_separator = get_backup_separator()
+    marker_prefix = get_marker_prefix()
 
-    # Log what we're trying to delete
     logger.info(
-        f"Attempting to unmark segment: string_id={segment.string.id}, "
-        f"locale={translation.target_locale}, context='{segment.context}', marker='{marker}'"
+        "Attempting to unmark segment: string_id=%s, locale_id=%s, context_id=%s",
+        segment.string_id,
+        translation.target_locale_id,
+        segment.context_id,
     )
 
-    # First, let's see ALL StringTranslation records for this string in this locale
-    all_for_string = StringTranslation.objects.filter(
-        translation_of=segment.string, locale=translation.target_locale
-    )
-    logger.info(
-        f"Total StringTranslation records for this string in locale: {all_for_string.count()}"
-    )
-    for st in all_for_string:
-        logger.info(f"  - id={st.id}, context='{st.context}', data='{st.data}'")
-
     # Find the marked translation (could be just marker or marker with encoded backup)
-    try:
-        # Try to find with exact marker first
-        try:
-            marked_translation = StringTranslation.objects.get(
-                translation_of=segment.string,
-                locale=translation.target_locale,
-                context=segment.context,
-                data=marker,
-            )
-            backup_data = None
-        except StringTranslation.DoesNotExist:
-            # Try to find with encoded backup
-            marked_translation = StringTranslation.objects.get(
-                translation_of=segment.string,
-                locale=translation.target_locale,
-                context=segment.context,
-                data__startswith=marker + backup_separator,
-            )
-            # Extract backup from encoded data: __DO_NOT_TRANSLATE__|backup|original_value
-            backup_data = (
-                marked_translation.data.split(backup_separator, 1)[1]
-                if backup_separator in marked_translation.data
-                else None
-            )
-            logger.info(f"Found backup in data field: '{backup_data}'")
-
-        if backup_data:
-            # Restore the backup
-            logger.info(f"Restoring backup translation: '{backup_data}'")
-            marked_translation.data = backup_data
-            marked_translation.save()
-            return 1  # Updated
-        else:
-            # No backup, just delete
-            marked_translation.delete()
-            logger.info("Deleted marked translation (no backup)")
-            return 1  # Deleted
+    marked_translation = (
+        StringTranslation.objects.filter(
+            translation_of_id=segment.string_id,
+            locale_id=translation.target_locale_id,
+            context_id=segment.context_id,
+        )
+        .filter(Q(data=marker) | Q(data__startswith=marker_prefix))
+        # StringTranslation.save() reads translation_of and wagtail-localize's
+        # post_save/post_delete handlers read the context
+        .select_related("translation_of", "context")
+        .first()
+    )
 
-    except StringTranslation.DoesNotExist:
+    if marked_translation is None:
         logger.info("No matching StringTranslation found to delete")
         return 0
 
+    # Extract backup from encoded data: __DO_NOT_TRANSLATE__|backup|original_value
+    backup_data = None
+    if marked_translation.data != marker:
+        backup_data = marked_translation.data[len(marker_prefix) :]
+
+    if backup_data:
+        # Restore the backup
+        logger.info("Restoring backup translation: %r", backup_data)
+        marked_translation.data = backup_data
+        marked_translation.save()
+        return 1  # Updated
+    else:
+        # No backup, just delete
+        marked_translation.delete()
+        logger.info("Deleted marked translation (no backup)")
+        return 1  # Deleted
+
 
 def is_do_not_translate(string_translation):
     """
@@ -210,10 +251,11 @@ def is_do_not_translate(string_translation):
         ...     print("Marked as do not translate")
     """
     validate_configuration()
+    data = string_translation.data
     marker = get_marker()
-    backup_separator = get_backup_separator()
-    return string_translation.data == marker or string_translation.data.startswith(
-        marker + backup_separator
+    # Most translations aren't marked, so reject them with a single prefix check
+    return data.startswith(marker) and (
+        data == marker or data.startswith(get_marker_prefix())
     )
 
 
@@ -235,40 +277,34 @@ def get_source_fallback_stats(translation):
         >>> print(f"{stats['do_not_translate']} segments marked as do not translate")
     """
     validate_configuration()
-    marker = get_marker()
-    backup_separator = get_backup_separator()
-
-    # Get all string IDs from segments belonging to this translation source
-    string_ids = StringSegment.objects.filter(source=translation.source).values_list(
-        "string_id", flat=True
-    )
 
-    # Query translations for these strings in the target locale
-    all_translations = StringTranslation.objects.filter(
-        locale=translation.target_locale, translation_of_id__in=string_ids
+    # String IDs of segments belonging to this translation source, used as a
+    # subquery so the IDs never round-trip through Python
+    string_ids = StringSegment.objects.filter(source_id=translation.source_id).values(
+        "string_id"
     )
 
     # Match both exact marker and encoded backup format
-    do_not_translate = all_translations.filter(
-        Q(data=marker) | Q(data__startswith=marker + backup_separator)
-    )
-    manually_translated = all_translations.exclude(
-        Q(data=marker) | Q(data__startswith=marker + backup_separator)
+    is_marked = Q(data=get_marker()) | Q(data__startswith=get_marker_prefix())
+
+    # Count translations for these strings in the target locale - single query
+    return StringTranslation.objects.filter(
+        locale_id=translation.target_locale_id, translation_of_id__in=string_ids
+    ).aggregate(
+        total=Count("id"),
+        do_not_translate=Count("id", filter=is_marked),
+        manually_translated=Count("id", filter=~is_marked),
     )
 
-    return {
-        "total": all_translations.count(),
-        "do_not_translate": do_not_translate.count(),
-        "manually_translated": manually_translated.count(),
-    }
-
 
 def bulk_mark_segments(translation, segments, user=None):
     """
     Mark multiple segments as "do not translate" using optimized batch operations.
 
-    This function uses bulk_create and bulk_update to minimize database queries,
-    making it highly performant even for large numbers of segments.
+    This function writes all translations with a single bulk_create upsert
+    (falling back to bulk_create and bulk_update on databases without
+    ON CONFLICT support), making it highly performant even for large numbers
+    of segments.
 
     Note: This function manually triggers post_save signals for created and updated
     StringTranslations to ensure other parts of the system (like wagtail-localize)
@@ -289,7 +325,7 @@ def bulk_mark_segments(translation, segments, user=None):
     """
     validate_configuration()
     marker = get_marker()
-    backup_separator = get_backup_separator()
+    marker_prefix = get_marker_prefix()
 
     with transaction.atomic():
         # Convert to list if needed and filter out segments without strings
@@ -300,86 +336,129 @@ def bulk_mark_segments(translation, segments, user=None):
 
         # Fetch existing translations once - single query
         string_ids = [s.string_id for s in segments]
+        # Contexts are read by wagtail-localize's post_save handler, so load them here
         existing_translations = StringTranslation.objects.filter(
             translation_of_id__in=string_ids,
-            locale=translation.target_locale,
-        ).select_related("translation_of")
+            locale_id=translation.target_locale_id,
+        ).select_related("context")
 
-        # Build lookup dict: (string_id, context) -> translation
+        # Build lookup dict: (string_id, context_id) -> translation
+        # Keyed on IDs so building the map doesn't lazy-load each context
         existing_map = {
-            (st.translation_of_id, st.context): st for st in existing_translations
+            (st.translation_of_id, st.context_id): st for st in existing_translations
         }
 
+        # Load the contexts of segments that need a new translation - single query
+        missing_context_ids = {
+            s.context_id
+            for s in segments
+            if (s.string_id, s.context_id) not in existing_map
+        }
+        contexts = (
+            TranslationContext.objects.in_bulk(missing_context_ids)
+            if missing_context_ids
+            else {}
+        )
+
         to_create = []
         to_update = []
 
         for segment in segments:
-            key = (segment.string_id, segment.context)
+            key = (segment.string_id, segment.context_id)
             existing = existing_map.get(key)
 
             if existing:
-                # Check if we need to backup
+                # Check if we need to backup; if it's already marked, keep any
+                # backup that is already encoded
                 if existing.data != marker and not existing.data.startswith(
-                    marker + backup_separator
+                    marker_prefix
                 ):
-                    existing.data = f"{marker}{backup_separator}{existing.data}"
-                else:
-                    existing.data = marker
+                    existing.data = f"{marker_prefix}{existing.data}"
                 existing.last_translated_by = user
                 existing.translation_type = StringTranslation.TRANSLATION_TYPE_MANUAL
                 to_update.append(existing)
             else:
                 to_create.append(
                     StringTranslation(
-                        translation_of=segment.string,
-                        locale=translation.target_locale,
-                        context=segment.context,
+                        translation_of_id=segment.string_id,
+                        locale_id=translation.target_locale_id,
+                        context=contexts[segment.context_id],
                         data=marker,
                         translation_type=StringTranslation.TRANSLATION_TYPE_MANUAL,
                         last_translated_by=user,
                     )
                 )
 
-        # Batch operations - 2 queries total instead of 2*N
-        created_count = 0
-        updated_count = 0
-
-        if to_create:
-            # Perform bulk create
-            StringTranslation.objects.bulk_create(to_create, batch_size=500)
-            created_count = len(to_create)
-            logger.info(f"Bulk created {created_count} StringTranslations")
+        update_fields = ["data", "last_translated_by", "translation_type"]
+        db_features = connections[router.db_for_write(StringTranslation)].features
 
-            # Manually trigger post_save signals since bulk_create doesn't trigger them
-            for st in to_create:
-                post_save.send(
-                    sender=StringTranslation,
-                    instance=st,
-                    created=True,
-                    update_fields=None,
-                    raw=False,
+        # Django < 5.0 doesn't set primary keys on upserted objects, and the
+        # created rows need them for the post_save signals below
+        if (
+            db_features.supports_update_conflicts
+            and db_features.can_return_rows_from_bulk_insert
+            and django.VERSION >= (5, 0)
+        ):
+            # Single upsert for new and existing translations. Existing rows are
+            # re-inserted as unsaved copies and resolved on the unique constraint.
+            upserts = to_create + [
+                StringTranslation(
+                    translation_of_id=st.translation_of_id,
+                    locale_id=st.locale_id,
+                    context_id=st.context_id,
+                    data=st.data,
+                    translation_type=st.translation_type,
+                    last_translated_by=user,
                 )
-
-        if to_update:
-            # Perform bulk update
-            StringTranslation.objects.bulk_update(
-                to_update,
-                ["data", "last_translated_by", "translation_type"],
+                for st in to_update
+            ]
+            StringTranslation.objects.bulk_create(
+                upserts,
+                update_conflicts=True,
+                # MySQL/MariaDB resolve conflicts on any unique key and don't accept a target
+                unique_fields=(
+                    ["locale", "translation_of", "context"]
+                    if db_features.supports_update_conflicts_with_target
+                    else None
+                ),
+                update_fields=update_fields,
                 batch_size=500,
             )
-            updated_count = len(to_update)
-            logger.info(f"Bulk updated {updated_count} StringTranslations")
-
-            # Manually trigger post_save signals since bulk_update doesn't trigger them
-            for st in to_update:
-                post_save.send(
-                    sender=StringTranslation,
-                    instance=st,
-                    created=False,
-                    update_fields=["data", "last_translated_by", "translation_type"],
-                    raw=False,
+        else:
+            # Batch operations - 2 queries total instead of 2*N
+            if to_create:
+                StringTranslation.objects.bulk_create(to_create, batch_size=500)
+            if to_update:
+                StringTranslation.objects.bulk_update(
+                    to_update, update_fields, batch_size=500
                 )
 
+        created_count = len(to_create)
+        updated_count = len(to_update)
+        logger.info(
+            "Bulk created %s and updated %s StringTranslations",
+            created_count,
+            updated_count,
+        )
+
+        # Manually trigger post_save signals since bulk operations don't trigger them
+        for st in to_create:
+            post_save.send(
+                sender=StringTranslation,
+                instance=st,
+                created=True,
+                update_fields=None,
+                raw=False,
+            )
+        for st in to_update:
+            post_save.send(
+                sender=StringTranslation,
+                instance=st,
+                created=False,
+                update_fields=update_fields,
+                raw=False,
+            )
+
         return created_count + updated_count
 
 
@@ -410,7 +489,7 @@ def bulk_unmark_segments(translation, segments):
     """
     validate_configuration()
     marker = get_marker()
-    backup_separator = get_backup_separator()
+    marker_prefix = get_marker_prefix()
 
     with transaction.atomic():
         # Convert to list if needed and filter out segments without strings
@@ -426,10 +505,11 @@ def bulk_unmark_segments(translation, segments):
         string_ids = [s.string_id for s in segments]
         marked_translations = (
             StringTranslation.objects.filter(
-                translation_of_id__in=string_ids, locale=translation.target_locale
+                translation_of_id__in=string_ids, locale_id=translation.target_locale_id
             )
-            .filter(Q(data=marker) | Q(data__startswith=marker + backup_separator))
-            .select_related("translation_of", "context")
+            .filter(Q(data=marker) | Q(data__startswith=marker_prefix))
+            # Contexts are read by wagtail-localize's post_save handler
+            .select_related("context")
         )
 
         to_delete = []
@@ -442,24 +522,15 @@ def bulk_unmark_segments(translation, segments):
                 continue
 
             # Check if has backup
-            if st.data.startswith(marker + backup_separator):
-                # Extract backup data
-                parts = st.data.split(backup_separator, 1)
-                if len(parts) > 1:
-                    backup_data = parts[1]
-                    st.data = backup_data
-                    to_update.append(st)
-                    segment_data[segment.id] = {
-                        "translated_value": backup_data,
-                        "source_value": segment.string.data if segment.string else "",
-                    }
-                else:
-                    # Malformed backup, delete it
-                    to_delete.append(st.id)
-                    segment_data[segment.id] = {
-                        "translated_value": None,
-                        "source_value": segment.string.data if segment.string else "",
-                    }
+            if st.data.startswith(marker_prefix):
+                # Extract backup data (everything after the prefix)
+                backup_data = st.data[len(marker_prefix) :]
+                st.data = backup_data
+                to_update.append(st)
+                segment_data[segment.id] = {
+                    "translated_value": backup_data,
+                    "source_value": segment.string.data if segment.string else "",
+                }
             else:
                 # No backup, delete the marker
                 to_delete.append(st.id)
@@ -475,13 +546,15 @@ def bulk_unmark_segments(translation, segments):
         if to_delete:
             # delete() triggers pre_delete and post_delete signals automatically
             deleted_count, _ = marked_translations.filter(id__in=to_delete).delete()
-            logger.info(f"Bulk deleted {deleted_count} StringTranslations")
+            logger.info("Bulk deleted %s StringTranslations", deleted_count)
 
         if to_update:
-            # Perform bulk update
-            StringTranslation.objects.bulk_update(to_update, ["data"], batch_size=500)
-            updated_count = len(to_update)
-            logger.info(f"Bulk updated {updated_count} StringTranslations")
+            # Strip the marker prefix in the database rather than sending every
+            # backup back in a CASE statement - single query
+            updated_count = marked_translations.filter(
+                data__startswith=marker_prefix
+            ).update(data=Substr("data", len(marker_prefix) + 1))
+            logger.info("Bulk updated %s StringTranslations", updated_count)
 
             # Manually trigger post_save signals since bulk_update doesn't trigger them
             for st in to_update:
@@ -513,26 +586,23 @@ def get_segments_do_not_translate(translation):
     """
     validate_configuration()
     marker = get_marker()
-    backup_separator = get_backup_separator()
+    marker_prefix = get_marker_prefix()
 
-    # Get all string IDs from segments belonging to this translation source
-    string_ids = StringSegment.objects.filter(source=translation.source).values_list(
-        "string_id", flat=True
+    # String IDs of segments belonging to this translation source, used as a
+    # subquery so the IDs never round-trip through Python
+    string_ids = StringSegment.objects.filter(source_id=translation.source_id).values(
+        "string_id"
     )
 
     # Find translations marked as "do not translate" (match both exact marker and encoded backup format)
     marked_string_translations = StringTranslation.objects.filter(
-        locale=translation.target_locale, translation_of_id__in=string_ids
-    ).filter(Q(data=marker) | Q(data__startswith=marker + backup_separator))
+        locale_id=translation.target_locale_id, translation_of_id__in=string_ids
+    ).filter(Q(data=marker) | Q(data__startswith=marker_prefix))
 
-    # Get the string IDs of marked translations
-    marked_string_ids = marked_string_translations.values_list(
-        "translation_of_id", flat=True
-    )
-
-    # Return the segments that have these marked strings
+    # Return the segments that have these marked strings (one SQL statement)
+    marked_string_ids = marked_string_translations.values("translation_of_id")
     return StringSegment.objects.filter(
-        source=translation.source, string_id__in=marked_string_ids
+        source_id=translation.source_id, string_id__in=marked_string_ids
     )
 
 
@@ -563,7 +633,7 @@ def migrate_do_not_translate_markers(translation_source, target_locale):
     """
     validate_configuration()
     marker = get_marker()
-    backup_separator = get_backup_separator()
+    marker_prefix = get_marker_prefix()
 
     # Get all current StringSegments for this source
     current_segments = StringSegment.objects.filter(
@@ -581,7 +651,7 @@ def migrate_do_not_translate_markers(translation_source, target_locale):
                 locale=target_locale,
                 context=segment.context,
             )
-            .filter(Q(data=marker) | Q(data__startswith=marker + backup_separator))
+            .filter(Q(data=marker) | Q(data__startswith=marker_prefix))
             .exclude(translation_of=segment.string)
         )
 
@@ -589,9 +659,12 @@ def migrate_do_not_translate_markers(translation_source, target_locale):
         for orphaned_marker in orphaned_markers:
             old_string_id = orphaned_marker.translation_of_id
             logger.info(
-                f"Migrating marker: context='{segment.context}', "
-                f"old_string_id={old_string_id} -> new_string_id={segment.string.id}, "
-                f"locale={target_locale}"
+                "Migrating marker: context=%r, old_string_id=%s -> new_string_id=%s, "
+                "locale=%s",
+                segment.context,
+                old_string_id,
+                segment.string.id,
+                target_locale,
             )
 
             # Check if there's already a StringTranslation for the new String
@@ -602,13 +675,14 @@ def migrate_do_not_translate_markers(translation_source, target_locale):
                 context=segment.context,
             ).exclude(id=orphaned_marker.id)
 
-            if existing_for_new_string.exists():
-                # Delete the existing one to avoid unique constraint violation
+            # Delete any existing one to avoid unique constraint violation
+            deleted, _ = existing_for_new_string.delete()
+            if deleted:
                 logger.info(
-                    f"Deleting existing StringTranslation for new String "
-                    f"to avoid conflict: {existing_for_new_string.first().id}"
+                    "Deleted %s existing StringTranslation(s) for new String "
+                    "to avoid conflict",
+                    deleted,
                 )
-                existing_for_new_string.delete()
 
             # Update the StringTranslation to point to the new String
             orphaned_marker.translation_of = segment.string
@@ -618,7 +692,10 @@ def migrate_do_not_translate_markers(translation_source, target_locale):
 
     if migrated_count > 0:
         logger.info(
-            f"Migrated {migrated_count} 'Do Not Translate' markers for source {translation_source.id} to locale {target_locale}"
+            "Migrated %s 'Do Not Translate' markers for source %s to locale %s",
+            migrated_count,
+            translation_source.id,
+            target_locale,
         )
 
     return migrated_count
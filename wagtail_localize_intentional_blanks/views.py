@@ -19,11 +19,12 @@ from wagtail_localize.models import (
     Translation,
 )
 
-from .constants import get_setting
+from .constants import get_cached_setting
 from .utils import (
     bulk_mark_segments,
     bulk_unmark_segments,
-    get_backup_separator,
+    get_marker,
+    get_marker_prefix,
     is_do_not_translate,
     mark_segment_do_not_translate,
     unmark_segment_do_not_translate,
@@ -43,7 +44,7 @@ def check_permission(user):
     Raises:
         PermissionDenied if user doesn't have permission
     """
-    required_permission = get_setting("REQUIRED_PERMISSION")
+    required_permission = get_cached_setting("REQUIRED_PERMISSION")
 
     if required_permission is None:
         # No specific permission required
@@ -89,14 +90,19 @@ def mark_segment_do_not_translate_view(request, translation_id, segment_id):
 
         # segment_id is the StringSegment ID (matches wagtail-localize's segment.id)
         logger.info(
-            f"Marking segment as do not translate: translation_id={translation_id}, segment_id={segment_id}"
+            "Marking segment as do not translate: translation_id=%s, segment_id=%s",
+            translation_id,
+            segment_id,
         )
 
-        segment = StringSegment.objects.get(id=segment_id, source=translation.source)
+        # The context is needed when a new StringTranslation is created
+        segment = StringSegment.objects.select_related("string", "context").get(
+            id=segment_id, source_id=translation.source_id
+        )
         string = segment.string
 
         if not string:
-            logger.error(f"StringSegment {segment_id} has no associated String")
+            logger.error("StringSegment %s has no associated String", segment_id)
             return JsonResponse(
                 {
                     "success": False,
@@ -137,21 +143,13 @@ def mark_segment_do_not_translate_view(request, translation_id, segment_id):
         translated_value = None
         if not do_not_translate:
             try:
-                existing_translation = StringTranslation.objects.get(
-                    translation_of=segment.string,
-                    locale=translation.target_locale,
-                    context=segment.context,
+                existing_translation = StringTranslation.objects.only("data").get(
+                    translation_of_id=segment.string_id,
+                    locale_id=translation.target_locale_id,
+                    context_id=segment.context_id,
                 )
-                validate_configuration()
-                marker = get_setting("MARKER")
-                backup_separator = get_backup_separator()
                 # Make sure it's not the marker or encoded marker format
-                if (
-                    existing_translation.data != marker
-                    and not existing_translation.data.startswith(
-                        marker + backup_separator
-                    )
-                ):
+                if not is_do_not_translate(existing_translation):
                     translated_value = existing_translation.data
             except StringTranslation.DoesNotExist:
                 pass
@@ -173,7 +171,9 @@ def mark_segment_do_not_translate_view(request, translation_id, segment_id):
 
     except StringSegment.DoesNotExist:
         logger.error(
-            f"StringSegment {segment_id} does not exist for translation {translation_id}"
+            "StringSegment %s does not exist for translation %s",
+            segment_id,
+            translation_id,
         )
         return JsonResponse(
             {
@@ -217,7 +217,9 @@ def get_segment_status(request, translation_id, segment_id):
         translation = Translation.objects.get(id=translation_id)
 
         # segment_id is the StringSegment ID (matches wagtail-localize's segment.id)
-        segment = StringSegment.objects.get(id=segment_id, source=translation.source)
+        segment = StringSegment.objects.select_related("string").get(
+            id=segment_id, source_id=translation.source_id
+        )
         string = segment.string
 
         if not string:
@@ -231,9 +233,11 @@ def get_segment_status(request, translation_id, segment_id):
             )
 
         try:
-            string_translation = StringTranslation.objects.get(
-                translation_of=segment.string,  # translation_of expects a String, not StringSegment
-                locale=translation.target_locale,
+            # Filter on all three columns of StringTranslation's unique index
+            string_translation = StringTranslation.objects.only("data").get(
+                translation_of_id=segment.string_id,
+                locale_id=translation.target_locale_id,
+                context_id=segment.context_id,
             )
             do_not_translate = is_do_not_translate(string_translation)
             translated_text = string_translation.data if not do_not_translate else None
@@ -259,7 +263,9 @@ def get_segment_status(request, translation_id, segment_id):
 
     except StringSegment.DoesNotExist:
         logger.error(
-            f"StringSegment {segment_id} does not exist for translation {translation_id}"
+            "StringSegment %s does not exist for translation %s",
+            segment_id,
+            translation_id,
         )
         return JsonResponse(
             {
@@ -309,37 +315,35 @@ def get_translation_status(request, translation_id):
 
         # Get all string translations for this translation source that are marked as "do not translate"
         validate_configuration()
-        marker = get_setting("MARKER")
-        backup_separator = get_backup_separator()
+        marker = get_marker()
+        marker_prefix = get_marker_prefix()
 
         # Get all StringSegments for this source
-        all_segments = StringSegment.objects.filter(
-            source=translation.source
-        ).select_related("string")
-        string_ids = list(all_segments.values_list("string_id", flat=True))
+        all_segments = StringSegment.objects.filter(source_id=translation.source_id)
 
-        # Get marked translations
+        # Get marked translations (segment string IDs stay a subquery). Only
+        # the string ID and source text are needed, so skip building models.
         marked_translations = (
             StringTranslation.objects.filter(
-                locale=translation.target_locale, translation_of_id__in=string_ids
+                locale_id=translation.target_locale_id,
+                translation_of_id__in=all_segments.values("string_id"),
             )
-            .filter(Q(data=marker) | Q(data__startswith=marker + backup_separator))
-            .select_related("translation_of")
+            .filter(Q(data=marker) | Q(data__startswith=marker_prefix))
+            .values_list("translation_of_id", "translation_of__data")
         )
 
         # Build a map: String ID -> StringSegment ID
-        string_to_segment_map = {seg.string_id: seg.id for seg in all_segments}
+        string_to_segment_map = dict(all_segments.values_list("string_id", "id"))
 
         # Build a mapping of StringSegment ID -> status
         segments = {}
-        for st in marked_translations:
-            string_id = st.translation_of.id
+        for string_id, source_text in marked_translations:
             segment_id = string_to_segment_map.get(string_id)
 
             if segment_id:
                 segments[str(segment_id)] = {
                     "do_not_translate": True,
-                    "source_text": st.translation_of.data,
+                    "source_text": source_text,
                 }
 
         return JsonResponse({"success": True, "segments": segments})
@@ -407,9 +411,9 @@ def toggle_all_do_not_translate_view(request, translation_id):
         # Get all StringSegments for this translation's source
         # Convert to list to avoid multiple queries
         segments = list(
-            StringSegment.objects.filter(source=translation.source).select_related(
-                "string"
-            )
+            StringSegment.objects.filter(
+                source_id=translation.source_id
+            ).select_related("string")
         )
 
         if not segments: